@@ -12,7 +12,16 @@ Running this file will:
    - data processing (sectoral decomposition, metrics)
    - modeling (smoothing, LMDI decomposition)
    - visualization (5 publication-ready figures)
-5. Export all tables and figures
+5. Export all tables (Parquet by default, CSV with --csv) and figures
+   (figures are skipped with --tables-only)
+
+Processing and modeling results are cached in output/processed/ and reused
+while neither the OWID CSV, the pipeline code nor the pandas/NumPy versions
+have changed.
+
+Independent work runs concurrently: the tables are exported from a thread
+pool, and the figures can be rendered in parallel processes
+(PIPELINE_PARALLEL_FIGURES=1).
 
 The pipeline is designed to be fully reproducible and deterministic.
 All domain logic lives in src/ modules with clear separation of concerns.
@@ -20,11 +29,22 @@ All domain logic lives in src/ modules with clear separation of concerns.
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import os
+import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional
 
-from src.config import get_config
+import numpy as np
+import pandas as pd
+
+from src.config import Config, get_config
 from src.utils import (
     ensure_directories_exist,
+    flush_logs,
     log,
     validate_file_exists,
     save_dataframe,
@@ -34,17 +54,82 @@ from src.utils import (
 from src.data_ingestion import load_owid_data
 from src.data_processing import process_raw_data
 from src.modeling import run_modeling
-from src.visualization import generate_all_figures
 from src.scenarios import compute_scenario_metrics
 
 
-def main() -> None:
+SRC_DIR = Path(__file__).resolve().parent / "src"
+
+
+def pipeline_cache_path(config: Config) -> Path:
+    """
+    Return the cache file for processing and modeling results.
+
+    The cache key combines the OWID CSV modification time, the pandas and
+    NumPy versions and a hash of main.py and the pipeline sources in src/, so
+    changing the data, the code or the libraries invalidates the cache.
+
+    Parameters
+    ----------
+    config : Config
+        Project configuration.
+
+    Returns
+    -------
+    Path
+        Pickle path under processed_data_dir.
+    """
+    digest = hashlib.sha1(str(config.owid_co2_csv.stat().st_mtime_ns).encode())
+    digest.update(f"pandas={pd.__version__};numpy={np.__version__}".encode())
+    for source in [Path(__file__).resolve(), *sorted(SRC_DIR.glob("*.py"))]:
+        digest.update(source.read_bytes())
+
+    return config.paths.processed_data_dir / f"pipeline_{digest.hexdigest()[:12]}.pkl"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line options for the pipeline.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Arguments to parse. Defaults to sys.argv[1:].
+
+    Returns
+    -------
+    argparse.Namespace
+        Parsed options.
+    """
+    parser = argparse.ArgumentParser(
+        description="Historical sectoral CO₂ emissions analysis pipeline."
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        help="Export tables as CSV instead of Parquet.",
+    )
+    parser.add_argument(
+        "--tables-only",
+        action="store_true",
+        help="Skip figure generation (matplotlib is then never imported).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Run the full historical sectoral emissions analysis pipeline.
 
     This function orchestrates the entire workflow.
     All error handling is explicit and logged.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command-line arguments (see parse_args).
     """
+    args = parse_args(argv)
+
     log("=" * 70)
     log("HISTORICAL SECTORAL CO₂ EMISSIONS ANALYSIS PIPELINE")
     log("=" * 70)
@@ -54,10 +139,11 @@ def main() -> None:
         # 1. Load configuration
         # ===================================================================
         log("\n[STEP 1/6] Loading configuration")
-        config = get_config()
+        config = get_config(export_format="csv" if args.csv else "parquet")
         log(f"  OWID CSV: {config.owid_co2_csv}")
-        log(f"  Output tables dir: {config.paths.tables_dir}")
+        log(f"  Output tables dir: {config.paths.tables_dir} ({config.export_format})")
         log(f"  Output figures dir: {config.paths.figures_dir}")
+        flush_logs()
 
         # ===================================================================
         # 2. Ensure output directories exist
@@ -72,6 +158,7 @@ def main() -> None:
             ]
         )
         log("  Output directories ready")
+        flush_logs()
 
         # ===================================================================
         # 3. Validate and load OWID data
@@ -82,13 +169,53 @@ def main() -> None:
         owid_world = load_owid_data(config)
 
         log(f"  Loaded {owid_world.shape[0]} years of global data")
+        flush_logs()
 
         # ===================================================================
-        # 4. Data processing (sectoral decomposition + metrics)
+        # 4-5. Processing + modeling (reused from cache when inputs are unchanged)
         # ===================================================================
-        log("\n[STEP 4/6] Processing raw data (sectoral analysis)")
-
-        processed = process_raw_data(owid_world, config)
+        cache_path = pipeline_cache_path(config)
+        processed = modeling_outputs = None
+
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    processed, modeling_outputs = pickle.load(f)
+            except Exception as e:
+                # e.g. a file truncated by an interrupted run: recompute
+                log(f"\n  Discarding unreadable cache {cache_path} ({type(e).__name__}: {e})")
+                processed = modeling_outputs = None
+                cache_path.unlink(missing_ok=True)
+
+        if processed is not None:
+            log("\n[STEP 4-5/6] Reusing cached processing and modeling results")
+            log(f"  Cache: {cache_path}")
+        else:
+            # ===============================================================
+            # 4. Data processing (sectoral decomposition + metrics)
+            # ===============================================================
+            log("\n[STEP 4/6] Processing raw data (sectoral analysis)")
+
+            processed = process_raw_data(owid_world, config)
+
+            # ===============================================================
+            # 5. Modeling (smoothing + LMDI decomposition)
+            # ===============================================================
+            log("\n[STEP 5/6] Running modeling (smoothing + LMDI)")
+
+            modeling_outputs = run_modeling(owid_world, processed["sector_long"], config)
+
+            # Keep only the cache for the current inputs
+            for stale in cache_path.parent.glob("pipeline_*.pkl"):
+                stale.unlink()
+
+            # Write to a temporary file and rename it into place, so an
+            # interrupted run never leaves a partial cache behind
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((processed, modeling_outputs), f, protocol=5)
+            os.replace(tmp_path, cache_path)
+            log(f"  Cached processing and modeling results: {cache_path}")
 
         sector_long = processed["sector_long"]
         sector_shares = processed["sector_shares"]
@@ -101,32 +228,39 @@ def main() -> None:
         log(f"  YoY changes computed: {yoy_changes.shape[0]} records")
         log(f"  Contributions computed: {contribution_to_yoy.shape[0]} records")
 
-        # ===================================================================
-        # 5. Modeling (smoothing + LMDI decomposition)
-        # ===================================================================
-        log("\n[STEP 5/6] Running modeling (smoothing + LMDI)")
-
-        modeling_outputs = run_modeling(owid_world, sector_long, config)
-
         sector_smoothed = modeling_outputs["sector_smoothed"]
         lmdi_decomposition = modeling_outputs["lmdi_decomposition"]
 
         log(f"  Smoothed sector timeseries: {sector_smoothed.shape[0]} records")
         log(f"  LMDI decomposition: {lmdi_decomposition.shape[0]} periods")
+        flush_logs()
 
         # ===================================================================
         # 6. Visualization
         # ===================================================================
         log("\n[STEP 6/6] Generating visualizations")
 
-        generate_all_figures(
-            total_by_year=total_by_year,
-            sector_long=sector_long,
-            sector_shares=sector_shares,
-            contribution_to_yoy=contribution_to_yoy,
-            lmdi_decomposition=lmdi_decomposition,
-            config=config,
-        )
+        if args.tables_only:
+            log("  Skipped (--tables-only)")
+        else:
+            # Imported lazily: matplotlib is only loaded when figures are wanted.
+            # Figures are only written to files: use the non-interactive Agg backend
+            import matplotlib
+
+            matplotlib.use("Agg")
+
+            from src.visualization import generate_all_figures
+
+            generate_all_figures(
+                total_by_year=total_by_year,
+                sector_long=sector_long,
+                sector_shares=sector_shares,
+                contribution_to_yoy=contribution_to_yoy,
+                lmdi_decomposition=lmdi_decomposition,
+                config=config,
+            )
+
+        flush_logs()
 
         # ===================================================================
         # 7. Export all tables to output/tables/
@@ -134,22 +268,29 @@ def main() -> None:
         log("\n[EXPORT] Saving processed tables")
 
         tables_to_export = {
-            "world_sector_emissions_long.csv": sector_long,
-            "world_sector_shares.csv": sector_shares,
-            "world_yoy_changes.csv": yoy_changes,
-            "world_contribution_to_yoy_total.csv": contribution_to_yoy,
-            "kaya_lmdi_decomposition.csv": lmdi_decomposition,
+            "world_sector_emissions_long": sector_long,
+            "world_sector_shares": sector_shares,
+            "world_yoy_changes": yoy_changes,
+            "world_contribution_to_yoy_total": contribution_to_yoy,
+            "kaya_lmdi_decomposition": lmdi_decomposition,
+            # Smoothed sector data, exported for reference
+            "sector_emissions_smoothed": sector_smoothed,
         }
 
-        for table_name, df in tables_to_export.items():
-            path = config.paths.tables_dir / table_name
-            save_dataframe(df, path)
-            log(f"  {table_name}: {df.shape[0]} rows exported")
+        # Tables are independent: overlap encoding of one with writing of another
+        with ThreadPoolExecutor(max_workers=min(len(tables_to_export), 8)) as executor:
+            futures = {}
+            for table_name, df in tables_to_export.items():
+                file_name = f"{table_name}.{config.export_format}"
+                path = config.paths.tables_dir / file_name
+                futures[executor.submit(save_dataframe, df, path)] = (file_name, df)
+
+            for future in as_completed(futures):
+                future.result()
+                file_name, df = futures[future]
+                log(f"  {file_name}: {df.shape[0]} rows exported")
 
-        # Also export smoothed sector data for reference
-        path_smoothed = config.paths.tables_dir / "sector_emissions_smoothed.csv"
-        save_dataframe(sector_smoothed, path_smoothed)
-        log(f"  sector_emissions_smoothed.csv: {sector_smoothed.shape[0]} rows exported")
+        flush_logs()
 
         # ===================================================================
         # Summary
@@ -158,8 +299,11 @@ def main() -> None:
         log("PIPELINE COMPLETED SUCCESSFULLY")
         log("=" * 70)
         log(f"\nGenerated outputs:")
-        log(f"  Tables (5): {config.paths.tables_dir}")
-        log(f"  Figures (5): {config.paths.figures_dir}")
+        log(f"  Tables ({len(tables_to_export)}): {config.paths.tables_dir}")
+        if args.tables_only:
+            log("  Figures: skipped (--tables-only)")
+        else:
+            log(f"  Figures (5): {config.paths.figures_dir}")
         log(f"\nKey results:")
         log(f"  - Total global CO2: {owid_world['co2'].min():.1f}–{owid_world['co2'].max():.1f} MtCO₂")
         log(f"  - Sectors analyzed: {sector_long['sector'].nunique()}")
@@ -169,6 +313,9 @@ def main() -> None:
     except Exception as e:
         log(f"\nERROR: {type(e).__name__}: {e}")
         sys.exit(1)
+    finally:
+        # Emit the summary (or error) before returning to the caller
+        flush_logs()
 
 
 if __name__ == "__main__":
@@ -30,7 +30,7 @@ class OutputPaths:
     figures_dir : Path
         Directory for generated PNG figures.
     tables_dir : Path
-        Directory for generated CSV tables.
+        Directory for generated tables (Parquet or CSV).
     """
     processed_data_dir: Path
     output_dir: Path
@@ -52,25 +52,46 @@ class Config:
         Path to the Our World in Data CO₂ dataset (CSV).
     paths : OutputPaths
         Output directory configuration.
+    export_format : str
+        File format of exported tables: "parquet" (default) or "csv".
     """
     owid_co2_csv: Path
     paths: OutputPaths
+    export_format: str = "parquet"
+
+
+EXPORT_FORMATS = ("parquet", "csv")
 
 
 # =====================================================================
 # Config factory
 # =====================================================================
-def get_config() -> Config:
+def get_config(export_format: str = "parquet") -> Config:
     """
     Build and return the project configuration.
 
     Resolves all paths relative to the project root and ensures consistency.
 
+    Parameters
+    ----------
+    export_format : str, default "parquet"
+        File format of exported tables ("parquet" or "csv").
+
     Returns
     -------
     Config
         Configuration object with dataset and output paths.
+
+    Raises
+    ------
+    ValueError
+        If export_format is not supported.
     """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format: {export_format} (expected one of {EXPORT_FORMATS})"
+        )
+
     project_root = Path(__file__).resolve().parents[1]
 
     owid_csv = project_root / "data/owid-co2-data.csv"
@@ -85,4 +106,5 @@ def get_config() -> Config:
     return Config(
         owid_co2_csv=owid_csv,
         paths=paths,
+        export_format=export_format,
     )
\ No newline at end of file
@@ -11,10 +11,59 @@ The dataset serves as the single source of truth for all sectoral analysis.
 
 from __future__ import annotations
 
+import os
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 
 from src.config import Config
-from src.utils import log, validate_file_exists
+from src.sector_mapping import SECTOR_COLUMNS
+from src.utils import ensure_directories_exist, log, safe_divide, validate_file_exists
+
+
+# =====================================================================
+# Required OWID columns
+# =====================================================================
+
+REQUIRED_COLUMNS = [
+    "country",
+    "year",
+    "iso_code",
+    "co2",
+    "population",
+    "gdp",
+    *SECTOR_COLUMNS,
+]
+
+# Arrow types used when parsing: strings for identifiers, int32 for year and
+# float64 for everything else. Emission/economic columns stay float64:
+# float32 would perturb the values written to the exported tables.
+OWID_COLUMN_TYPES = {col: pa.float64() for col in REQUIRED_COLUMNS}
+OWID_COLUMN_TYPES.update(
+    country=pa.string(),
+    iso_code=pa.string(),
+    year=pa.int32(),
+)
+
+# Parquet cache of the filtered World frame (under processed_data_dir)
+OWID_WORLD_CACHE = "owid_world.parquet"
+
+
+def _matches_owid_schema(df: pd.DataFrame) -> bool:
+    """
+    Check that a cached World frame has every required column with the Arrow
+    type given in OWID_COLUMN_TYPES (so type changes invalidate the cache).
+    """
+    for col, arrow_type in OWID_COLUMN_TYPES.items():
+        if col not in df.columns:
+            return False
+        dtype = df[col].dtype
+        if not isinstance(dtype, pd.ArrowDtype) or dtype.pyarrow_dtype != arrow_type:
+            return False
+    return True
 
 
 def load_owid_data(config: Config) -> pd.DataFrame:
@@ -24,6 +73,11 @@ def load_owid_data(config: Config) -> pd.DataFrame:
     Loads the CSV file specified in configuration, filters to the World aggregate,
     validates that all required columns exist, and sorts by year.
 
+    The CSV is parsed with pyarrow's streaming reader and the returned frame uses
+    Arrow-backed dtypes (``pd.ArrowDtype``). The filtered frame is cached as
+    Parquet in ``processed_data_dir`` and reused on later runs as long as the
+    cache is newer than the CSV, readable, and has the expected column types.
+
     Parameters
     ----------
     config : Config
@@ -53,42 +107,67 @@ def load_owid_data(config: Config) -> pd.DataFrame:
     # Validate file exists
     validate_file_exists(config.owid_co2_csv, "OWID CO₂ CSV")
 
-    # Load CSV
-    df = pd.read_csv(config.owid_co2_csv)
-
-    log(f"OWID dataset loaded: {df.shape[0]:,} rows, {df.shape[1]} columns")
+    # ===================================================================
+    # Reuse the cached World frame if it is up to date
+    # ===================================================================
+    cache_path = config.paths.processed_data_dir / OWID_WORLD_CACHE
+
+    if (
+        cache_path.exists()
+        and cache_path.stat().st_mtime >= config.owid_co2_csv.stat().st_mtime
+    ):
+        try:
+            df_cached = pd.read_parquet(
+                cache_path, engine="pyarrow", dtype_backend="pyarrow"
+            )
+        except Exception as e:
+            # e.g. a file truncated by an interrupted run
+            log(f"Cached World aggregate is unreadable ({type(e).__name__}); reloading CSV")
+        else:
+            if _matches_owid_schema(df_cached):
+                log(f"Loaded cached World aggregate: {cache_path} ({df_cached.shape[0]} rows)")
+                return df_cached
+            log("Cached World aggregate does not match the expected schema; reloading CSV")
 
     # ===================================================================
-    # Validate required columns
+    # Stream CSV (required columns only), keeping World rows batch by batch
     # ===================================================================
-    required_cols = {
-        "country",
-        "year",
-        "iso_code",
-        "co2",
-        "population",
-        "gdp",
-        "coal_co2",
-        "oil_co2",
-        "gas_co2",
-        "cement_co2",
-        "flaring_co2",
-        "other_industry_co2",
-    }
-
-    missing = required_cols - set(df.columns)
-    if missing:
-        raise ValueError(
-            f"OWID dataset missing required columns: {missing}"
+    try:
+        reader = pa_csv.open_csv(
+            config.owid_co2_csv,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=REQUIRED_COLUMNS,
+                column_types=OWID_COLUMN_TYPES,
+            ),
         )
-
-    log(f"All required columns present: {sorted(required_cols)}")
+    except KeyError as e:
+        # pyarrow raises when include_columns names are absent; re-read the
+        # header only to report exactly which columns are missing.
+        header = pd.read_csv(config.owid_co2_csv, nrows=0).columns
+        missing = set(REQUIRED_COLUMNS) - set(header)
+        if missing:
+            raise ValueError(
+                f"OWID dataset missing required columns: {missing}"
+            ) from e
+        raise
+
+    n_rows = 0
+    world_batches = []
+    with reader:
+        for batch in reader:
+            n_rows += batch.num_rows
+            world_batches.append(batch.filter(pc.equal(batch["country"], "World")))
+
+    log(f"OWID dataset scanned: {n_rows:,} rows, {len(REQUIRED_COLUMNS)} columns")
+    log(f"All required columns present: {sorted(REQUIRED_COLUMNS)}")
 
     # ===================================================================
     # Filter to World aggregate
     # ===================================================================
-    df_world = df[df["country"] == "World"].copy()
-    
+    df_world = pa.Table.from_batches(world_batches, schema=reader.schema).to_pandas(
+        types_mapper=pd.ArrowDtype
+    )
+
     if df_world.empty:
         raise ValueError("No 'World' aggregate found in OWID dataset")
 
@@ -106,20 +185,18 @@ def load_owid_data(config: Config) -> pd.DataFrame:
     # ===================================================================
     # Validate and log component sum check (latest year)
     # ===================================================================
-    latest_year_data = df_world[df_world["year"] == max_year].iloc[0]
-    total_co2 = latest_year_data["co2"]
-    component_sum = (
-        latest_year_data["coal_co2"]
-        + latest_year_data["oil_co2"]
-        + latest_year_data["gas_co2"]
-        + latest_year_data["cement_co2"]
-        + latest_year_data["flaring_co2"]
-        + latest_year_data["other_industry_co2"]
+    # Data is sorted by year, so the last row is the latest year
+    # Missing values become NaN (not pd.NA) and carry through the sum, so a
+    # gap in the latest year shows up as NaN in the log instead of raising
+    latest = df_world.iloc[-1][["co2", *SECTOR_COLUMNS]].to_numpy(
+        dtype=np.float64, na_value=np.nan
     )
-    
+    total_co2 = float(latest[0])
+    component_sum = float(np.sum(latest[1:]))
+
     diff = abs(total_co2 - component_sum)
-    pct_diff = (diff / total_co2 * 100) if total_co2 != 0 else 0
-    
+    pct_diff = safe_divide(diff, total_co2) * 100
+
     log(
         f"Component sum check (year {max_year}): "
         f"total_co2={total_co2:.2f}, "
@@ -127,4 +204,15 @@ def load_owid_data(config: Config) -> pd.DataFrame:
         f"diff={diff:.4f} ({pct_diff:.3f}%)"
     )
 
-    return df_world
\ No newline at end of file
+    # ===================================================================
+    # Cache for subsequent runs
+    # ===================================================================
+    # Write to a temporary file and rename it into place, so an interrupted
+    # run never leaves a partial cache behind
+    ensure_directories_exist([cache_path.parent])
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    df_world.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+    os.replace(tmp_path, cache_path)
+    log(f"Cached World aggregate: {cache_path}")
+
+    return df_world
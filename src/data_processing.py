@@ -42,19 +42,15 @@ def compute_sector_shares(
         Table with columns: year, sector, share_of_total.
         share_of_total is in (0, 1) and represents the fraction of total emissions.
     """
-    df = sector_long.copy()
+    # Look up total emissions for each year
+    total_co2 = sector_long["year"].map(total_by_year)
 
-    # Merge in total emissions for each year
-    df = df.merge(
-        total_by_year.rename("total_co2").reset_index(),
-        on="year",
-        how="left",
+    # Compute share (assign returns a new frame; the input is left untouched)
+    df = sector_long[["year", "sector"]].assign(
+        share_of_total=safe_divide(sector_long["emissions_mtco2"], total_co2)
     )
 
-    # Compute share
-    df["share_of_total"] = safe_divide(df["emissions_mtco2"], df["total_co2"])
-
-    return df[["year", "sector", "share_of_total"]].sort_values(["year", "sector"]).reset_index(drop=True)
+    return df.sort_values(["year", "sector"]).reset_index(drop=True)
 
 
 def compute_yoy_changes(sector_long: pd.DataFrame) -> pd.DataFrame:
@@ -70,25 +66,23 @@ def compute_yoy_changes(sector_long: pd.DataFrame) -> pd.DataFrame:
     -------
     pd.DataFrame
         Table with columns: year, sector, emissions_mtco2, yoy_change_mtco2, yoy_change_pct.
+        Sorted by sector, then year.
         First year for each sector has NaN changes (no prior year).
     """
-    df = sector_long.copy()
+    # Group by sector and compute change (sort_values returns a new frame)
+    df = sector_long.sort_values(["sector", "year"]).reset_index(drop=True)
 
-    # Group by sector and compute change
-    df = df.sort_values(["sector", "year"]).reset_index(drop=True)
-
-    df["yoy_change_mtco2"] = df.groupby("sector")["emissions_mtco2"].diff()
-    df["yoy_change_pct"] = safe_divide(
-        df["yoy_change_mtco2"],
-        df.groupby("sector")["emissions_mtco2"].shift(1)
-    )
+    # One grouped shift serves both the absolute and the percentage change
+    prev = df.groupby("sector", sort=False, observed=True)["emissions_mtco2"].shift(1)
+    df["yoy_change_mtco2"] = df["emissions_mtco2"] - prev
+    df["yoy_change_pct"] = safe_divide(df["yoy_change_mtco2"], prev)
 
-    return df.sort_values(["year", "sector"]).reset_index(drop=True)
+    return df
 
 
 def compute_contribution_to_total_change(
     sector_yoy: pd.DataFrame,
-    total_yoy: pd.DataFrame,
+    total_yoy: pd.Series,
 ) -> pd.DataFrame:
     """
     Compute each sector's contribution to total annual CO₂ change.
@@ -97,8 +91,8 @@ def compute_contribution_to_total_change(
     ----------
     sector_yoy : pd.DataFrame
         Sectoral YoY changes (year, sector, yoy_change_mtco2).
-    total_yoy : pd.DataFrame
-        Total CO₂ YoY changes (year, yoy_change_mtco2).
+    total_yoy : pd.Series
+        Total CO₂ YoY changes, indexed by year.
 
     Returns
     -------
@@ -107,14 +101,12 @@ def compute_contribution_to_total_change(
         contribution_share = delta_sector / delta_total.
         Where delta_total == 0, contribution_share is NaN.
     """
-    df = sector_yoy[["year", "sector", "yoy_change_mtco2"]].copy()
-    df = df.rename(columns={"yoy_change_mtco2": "delta_mtco2"})
-
-    # Merge total change
-    total_rename = total_yoy[["year", "yoy_change_mtco2"]].copy()
-    total_rename = total_rename.rename(columns={"yoy_change_mtco2": "delta_total"})
+    df = sector_yoy[["year", "sector", "yoy_change_mtco2"]].rename(
+        columns={"yoy_change_mtco2": "delta_mtco2"}
+    )
 
-    df = df.merge(total_rename, on="year", how="left")
+    # Look up total change for each year
+    df["delta_total"] = df["year"].map(total_yoy)
 
     # Compute contribution share
     df["contribution_share"] = safe_divide(df["delta_mtco2"], df["delta_total"])
@@ -132,7 +124,8 @@ def process_raw_data(
     Parameters
     ----------
     owid_world : pd.DataFrame
-        Loaded and validated OWID world data.
+        Loaded and validated OWID world data. Repeated years are reduced to
+        their last row before any metric is computed.
     config : Config
         Project configuration (unused but kept for consistency).
 
@@ -147,6 +140,13 @@ def process_raw_data(
     """
     log("Starting data processing")
 
+    # Year is the join key for every table below (totals are looked up by
+    # year), so keep one row per year: the last one, as for a later revision
+    if not owid_world["year"].is_unique:
+        n_duplicates = int(owid_world["year"].duplicated().sum())
+        log(f"Dropping {n_duplicates} duplicate year row(s), keeping the last of each")
+        owid_world = owid_world.drop_duplicates("year", keep="last", ignore_index=True)
+
     # ===================================================================
     # Extract sectoral emissions (long format)
     # ===================================================================
@@ -171,11 +171,8 @@ def process_raw_data(
     sector_yoy = compute_yoy_changes(sector_long)
     log("Year-on-year changes computed")
 
-    # Compute total YoY for reference
-    total_yoy = pd.DataFrame({
-        "year": owid_world["year"],
-        "yoy_change_mtco2": owid_world["co2"].diff(),
-    })
+    # Compute total YoY for reference (reuses the year-indexed total)
+    total_yoy = total_by_year.diff().rename("delta_total")
 
     # ===================================================================
     # Compute contributions
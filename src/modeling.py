@@ -87,44 +87,46 @@ def smooth_timeseries(
 # =====================================================================
 
 def _log_mean_divisia_index(
-    value_start: float,
-    value_end: float,
-    co2_start: float,
-    co2_end: float,
-) -> float:
+    co2_start: np.ndarray,
+    co2_end: np.ndarray,
+) -> np.ndarray:
     """
-    Compute the LMDI weighting factor.
+    Compute the LMDI weighting factor for arrays of start/end CO2 values.
 
     The LMDI approach uses a geometric mean-based weighting:
       L = (CO2_end - CO2_start) / (ln(CO2_end) - ln(CO2_start))
     
-    If the change is very small or both values are equal, returns the start CO2 value.
+    Where the change is very small or the log ratio vanishes, the start CO2 value
+    is returned instead (or 1.0 if it is zero). Evaluated element-wise, without
+    Python-level branching.
 
     Parameters
     ----------
-    value_start : float
-        Initial value of the factor (e.g., population, GDP/capita, CO2/GDP).
-    value_end : float
-        Final value of the factor.
-    co2_start : float
-        Initial total CO2.
-    co2_end : float
-        Final total CO2.
+    co2_start : np.ndarray
+        Initial total CO2 per period.
+    co2_end : np.ndarray
+        Final total CO2 per period.
 
     Returns
     -------
-    float
-        LMDI weighting factor.
+    np.ndarray
+        LMDI weighting factor per period.
     """
-    if abs(co2_end - co2_start) < 1e-9:
-        # No change in CO2, return start value
-        return co2_start if co2_start != 0 else 1.0
+    co2_start = np.asarray(co2_start, dtype=np.float64)
+    co2_end = np.asarray(co2_end, dtype=np.float64)
 
-    ln_ratio = np.log(co2_end) - np.log(co2_start)
-    if abs(ln_ratio) < 1e-9:
-        return co2_start if co2_start != 0 else 1.0
+    delta = co2_end - co2_start
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ln_ratio = np.log(co2_end) - np.log(co2_start)
 
-    return (co2_end - co2_start) / ln_ratio
+    degenerate = (np.abs(delta) < 1e-9) | (np.abs(ln_ratio) < 1e-9)
+    fallback = np.where(co2_start != 0, co2_start, 1.0)
+
+    return np.where(
+        degenerate,
+        fallback,
+        delta / np.where(degenerate, 1.0, ln_ratio),
+    )
 
 
 def compute_kaya_lmdi(
@@ -160,10 +162,16 @@ def compute_kaya_lmdi(
     - Years outside the dataset range are logged with a warning but analysis continues.
     - If a required year is missing, the closest available year is substituted.
     """
-    df = world_df.copy().sort_values("year").reset_index(drop=True)
+    df = world_df.sort_values("year")
+
+    # Log ratios are evaluated in double precision regardless of input dtypes
+    years = df["year"].to_numpy()
+    pop = df["population"].to_numpy(dtype=np.float64)
+    gdp = df["gdp"].to_numpy(dtype=np.float64)
+    co2 = df["co2"].to_numpy(dtype=np.float64)
 
     if periods is None:
-        max_year = df["year"].max()
+        max_year = years.max()
         periods = [
             (1990, max_year),
             (2000, 2019),
@@ -172,55 +180,53 @@ def compute_kaya_lmdi(
 
     log(f"Computing LMDI decomposition for {len(periods)} periods")
 
-    results = []
+    # Find closest available years for all periods at once
+    starts = np.array([p[0] for p in periods])
+    ends = np.array([p[1] for p in periods])
 
-    for start_year, end_year in periods:
-        # Find closest available years
-        start_data = df.loc[(df["year"] - start_year).abs().idxmin()]
-        end_data = df.loc[(df["year"] - end_year).abs().idxmin()]
+    si = np.abs(years[:, None] - starts).argmin(axis=0)
+    ei = np.abs(years[:, None] - ends).argmin(axis=0)
 
-        actual_start_year = int(start_data["year"])
-        actual_end_year = int(end_data["year"])
+    actual_starts = years[si]
+    actual_ends = years[ei]
 
-        if actual_start_year != start_year or actual_end_year != end_year:
+    for start_year, end_year, actual_start, actual_end in zip(
+        starts, ends, actual_starts, actual_ends
+    ):
+        if actual_start != start_year or actual_end != end_year:
             log(
-                f"Period {start_year}–{end_year}: adjusted to {actual_start_year}–{actual_end_year}"
+                f"Period {start_year}–{end_year}: adjusted to {actual_start}–{actual_end}"
             )
 
-        # Extract Kaya factors
-        p_start = start_data["population"]
-        p_end = end_data["population"]
-
-        a_start = safe_divide(start_data["gdp"], start_data["population"])
-        a_end = safe_divide(end_data["gdp"], end_data["population"])
+    # Extract Kaya factors
+    p_start, p_end = pop[si], pop[ei]
 
-        i_start = safe_divide(start_data["co2"], start_data["gdp"])
-        i_end = safe_divide(end_data["co2"], end_data["gdp"])
+    a_start = safe_divide(gdp[si], pop[si])
+    a_end = safe_divide(gdp[ei], pop[ei])
 
-        co2_start = start_data["co2"]
-        co2_end = end_data["co2"]
+    i_start = safe_divide(co2[si], gdp[si])
+    i_end = safe_divide(co2[ei], gdp[ei])
 
-        # Compute LMDI weighting
-        L = _log_mean_divisia_index(p_start, p_end, co2_start, co2_end)
+    co2_start, co2_end = co2[si], co2[ei]
 
-        # Compute effects
-        effect_p = L * np.log(p_end / p_start) if p_start > 0 else np.nan
-        effect_a = L * np.log(a_end / a_start) if a_start > 0 else np.nan
-        effect_i = L * np.log(i_end / i_start) if i_start > 0 else np.nan
+    # Compute LMDI weighting
+    L = _log_mean_divisia_index(co2_start, co2_end)
 
-        delta_co2 = co2_end - co2_start
+    # Compute effects (NaN where the baseline factor is not positive)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effect_p = np.where(p_start > 0, L * np.log(p_end / p_start), np.nan)
+        effect_a = np.where(a_start > 0, L * np.log(a_end / a_start), np.nan)
+        effect_i = np.where(i_start > 0, L * np.log(i_end / i_start), np.nan)
 
-        results.append({
-            "period": f"{actual_start_year}–{actual_end_year}",
-            "effect_population": effect_p,
-            "effect_affluence": effect_a,
-            "effect_intensity": effect_i,
-            "delta_co2": delta_co2,
-        })
+    lmdi_table = pd.DataFrame({
+        "period": [f"{s}–{e}" for s, e in zip(actual_starts, actual_ends)],
+        "effect_population": effect_p,
+        "effect_affluence": effect_a,
+        "effect_intensity": effect_i,
+        "delta_co2": co2_end - co2_start,
+    })
 
-    lmdi_table = pd.DataFrame(results)
-
-    log(f"LMDI decomposition computed for {len(results)} periods")
+    log(f"LMDI decomposition computed for {len(lmdi_table)} periods")
 
     return lmdi_table
 
@@ -262,24 +268,27 @@ def run_modeling(
     # ===================================================================
     # Smoothed sectoral series
     # ===================================================================
-    sector_smoothed = sector_long.copy()
-
-    sector_smoothed = sector_smoothed.sort_values(["sector", "year"]).reset_index(drop=True)
+    # sort_values already returns a new frame, so no explicit copy is needed
+    sector_smoothed = sector_long.sort_values(["sector", "year"]).reset_index(drop=True)
 
-    sector_smoothed["emissions_smoothed"] = sector_smoothed.groupby("sector")[
-        "emissions_mtco2"
-    ].transform(lambda x: smooth_timeseries(x, window=5))
+    # Single grouped rolling pass (same semantics as smooth_timeseries, window=5)
+    sector_smoothed["emissions_smoothed"] = (
+        sector_smoothed.groupby("sector", sort=False, observed=True)["emissions_mtco2"]
+        .rolling(window=5, center=True, min_periods=1)
+        .mean()
+        .reset_index(level=0, drop=True)
+    )
 
     log(f"Smoothed {len(sector_smoothed)} sector-year records")
 
     # ===================================================================
     # Kaya LMDI decomposition
     # ===================================================================
-    lmdi = compute_kaya_lmdi(owid_world)
+    lmdi_decomposition = compute_kaya_lmdi(owid_world)
 
     log("Modeling step completed")
 
     return {
         "sector_smoothed": sector_smoothed,
-        "lmdi_decomposition": lmdi,
+        "lmdi_decomposition": lmdi_decomposition,
     }
@@ -8,11 +8,17 @@ This module defines the mapping between OWID raw dataset columns
 the analysis.
 
 It also provides extraction functions to convert the wide-format OWID data
-into a long-format sectoral dataset.
+into a long-format sectoral dataset. The reshape uses NumPy; setting the
+``PIPELINE_USE_POLARS=1`` environment variable opts into an equivalent Polars
+implementation (polars >= 1.0, optional). Both return the same pandas DataFrame.
 """
 
 from __future__ import annotations
 
+import os
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
 from src.utils import log
@@ -34,6 +40,9 @@ SECTOR_MAPPING = {
 SECTOR_COLUMNS = list(SECTOR_MAPPING.keys())
 CANONICAL_SECTORS = list(SECTOR_MAPPING.values())
 
+# Set to "1" to reshape with Polars (when a compatible version is installed)
+USE_POLARS_ENV = "PIPELINE_USE_POLARS"
+
 
 # =====================================================================
 # Extraction functions
@@ -56,7 +65,8 @@ def extract_sector_long(df_world: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Long-format DataFrame with columns: year, sector, emissions_mtco2.
         Rows with NaN emissions are dropped.
-        Sorted by year, then sector.
+        ``sector`` is an ordered categorical following CANONICAL_SECTORS.
+        Sorted by year, then sector (canonical order).
 
     Notes
     -----
@@ -65,33 +75,112 @@ def extract_sector_long(df_world: pd.DataFrame) -> pd.DataFrame:
     """
     log("Extracting sectoral CO₂ emissions to long format")
 
-    # Select relevant columns and melt to long format
-    df_melt = df_world[["year"] + SECTOR_COLUMNS].copy()
+    df_long = None
+    if os.environ.get(USE_POLARS_ENV, "0") == "1":
+        df_long = _extract_sector_long_polars(df_world)
+    if df_long is None:
+        df_long = _extract_sector_long_numpy(df_world)
 
-    df_long = df_melt.melt(
-        id_vars=["year"],
-        value_vars=SECTOR_COLUMNS,
-        var_name="sector_col",
-        value_name="emissions_mtco2",
+    log(
+        f"Extracted {len(df_long)} sector-year records "
+        f"across {len(CANONICAL_SECTORS)} sectors"
     )
 
-    # Map column names to canonical sector names
-    df_long["sector"] = df_long["sector_col"].map(SECTOR_MAPPING)
-    df_long = df_long.drop(columns=["sector_col"])
+    return df_long
+
 
-    # Coerce to float and drop NaN
-    df_long["emissions_mtco2"] = pd.to_numeric(
-        df_long["emissions_mtco2"], errors="coerce"
+def _extract_sector_long_numpy(df_world: pd.DataFrame) -> pd.DataFrame:
+    """
+    NumPy implementation of extract_sector_long (see its docstring).
+    """
+    # Reshape the (year × sector) matrix into long format with NumPy:
+    # row-major flattening pairs each year with every sector in order.
+    years = df_world["year"].to_numpy()
+    emissions = df_world[SECTOR_COLUMNS].to_numpy(
+        dtype=np.float64, na_value=np.nan
+    ).reshape(-1)
+
+    year_col = np.repeat(years, len(SECTOR_COLUMNS))
+    # Sector codes index into CANONICAL_SECTORS (no per-row string handling)
+    sector_codes = np.tile(np.arange(len(CANONICAL_SECTORS), dtype=np.int8), len(years))
+
+    # Drop NaN emissions in one pass
+    mask = ~np.isnan(emissions)
+
+    # Columns are built with their final dtypes, so the frame takes them as-is
+    # (copy=False) without dtype inference.
+    # Sector is an ordered categorical in canonical order (Coal, Oil, Gas, ...),
+    # so groupbys work on integer codes and pivots come out in that order
+    year = year_col[mask].astype(np.int32, copy=False)
+    df_long = pd.DataFrame(
+        {
+            "year": year,
+            "emissions_mtco2": emissions[mask],
+            "sector": pd.Categorical.from_codes(
+                sector_codes[mask], categories=CANONICAL_SECTORS, ordered=True
+            ),
+        },
+        index=pd.RangeIndex(year.size),
+        copy=False,
     )
 
-    df_long = df_long.dropna(subset=["emissions_mtco2"])
+    # Rows are already in (year, canonical sector) order when the input years
+    # are strictly increasing, as load_owid_data guarantees; repeated years
+    # would interleave sectors, so sort in every other case
+    if not np.all(np.diff(years) > 0):
+        df_long = df_long.sort_values(["year", "sector"], ignore_index=True)
 
-    # Sort and reset index
-    df_long = df_long.sort_values(["year", "sector"]).reset_index(drop=True)
+    return df_long
 
-    log(
-        f"Extracted {len(df_long)} sector-year records "
-        f"across {len(CANONICAL_SECTORS)} sectors"
+
+def _extract_sector_long_polars(df_world: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Polars implementation of extract_sector_long (see its docstring).
+
+    Unpivot, null filtering and ordering run in Polars over Arrow buffers;
+    the result is handed back as a pandas DataFrame. Returns None when polars
+    is missing or predates ``unpivot``/``Enum`` (1.0), so the caller can fall
+    back to the NumPy path.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        log(f"{USE_POLARS_ENV} is set but polars is not installed; using NumPy")
+        return None
+
+    if not (hasattr(pl.DataFrame, "unpivot") and hasattr(pl, "Enum")):
+        log(f"polars {pl.__version__} is too old (need >= 1.0); using NumPy")
+        return None
+
+    df_long = (
+        pl.from_pandas(df_world[["year", *SECTOR_COLUMNS]])
+        .with_columns(pl.col("year").cast(pl.Int32))
+        .unpivot(
+            index="year",
+            on=SECTOR_COLUMNS,
+            variable_name="sector_col",
+            value_name="emissions_mtco2",
+        )
+        # Enum over SECTOR_COLUMNS: the physical codes index CANONICAL_SECTORS
+        .with_columns(
+            pl.col("sector_col")
+            .cast(pl.Enum(SECTOR_COLUMNS))
+            .to_physical()
+            .alias("sector")
+        )
+        .drop("sector_col")
+        .drop_nulls("emissions_mtco2")
+        .filter(pl.col("emissions_mtco2").is_not_nan())
+        # unpivot stacks the sector columns in canonical order, so a stable
+        # sort on year yields (year, canonical sector) order
+        .sort("year", maintain_order=True)
+        .to_pandas()
+    )
+
+    df_long["emissions_mtco2"] = df_long["emissions_mtco2"].astype(np.float64)
+    # Build the categorical from codes: no per-row string lookup or hashing
+    df_long["sector"] = pd.Categorical.from_codes(
+        df_long["sector"].to_numpy(), categories=CANONICAL_SECTORS, ordered=True
     )
 
     return df_long
@@ -17,12 +17,18 @@ Design principles:
 
 from __future__ import annotations
 
+import atexit
+import csv
+import io
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional, Union
+from typing import Callable, Iterable, Optional, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 
 def ensure_directories_exist(directories: Iterable[Path]) -> None:
@@ -64,6 +70,35 @@ def validate_file_exists(path: Path, description: Optional[str] = None) -> None:
         raise FileNotFoundError(f"Required file not found: {label}")
 
 
+def _write_csv_arrow(df: pd.DataFrame, path: Path) -> bool:
+    """
+    Write a DataFrame (without its index) with pyarrow's CSV writer.
+
+    The header and values are written unquoted, as ``DataFrame.to_csv`` does
+    for plain tables. Returns False when Arrow cannot convert the frame or a
+    value would need quoting, so the caller can fall back to pandas.
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        header = io.StringIO()
+        csv.writer(header, lineterminator="\n").writerow(df.columns)
+
+        with open(path, "wb") as f:
+            f.write(header.getvalue().encode("utf-8"))
+            pa_csv.write_csv(
+                table,
+                f,
+                write_options=pa_csv.WriteOptions(
+                    include_header=False, quoting_style="none"
+                ),
+            )
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return False
+
+    return True
+
+
 def save_dataframe(
     df: pd.DataFrame,
     path: Path,
@@ -90,17 +125,62 @@ def save_dataframe(
     ------
     ValueError
         If the file extension is not supported.
+
+    Notes
+    -----
+    CSV files are written with pyarrow's C++ writer when possible, falling
+    back to ``DataFrame.to_csv`` (e.g. with ``index=True`` or when a value
+    needs quoting). Whole-number floats are then written as ``0`` rather
+    than ``0.0``; parsed values are identical.
     """
     if path.suffix == ".csv":
-        df.to_csv(path, index=index)
+        if index or not _write_csv_arrow(df, path):
+            df.to_csv(path, index=index)
     elif path.suffix == ".parquet":
-        df.to_parquet(path, index=index)
+        # Dictionary encoding keeps repeated labels (e.g. sector) compact
+        df.to_parquet(
+            path,
+            engine="pyarrow",
+            compression="snappy",
+            use_dictionary=True,
+            index=index,
+        )
     else:
         raise ValueError(
             f"Unsupported file format for saving DataFrame: {path.suffix}"
         )
 
 
+# Arrays at least this long take the fused Numba kernel (when installed);
+# below it, thread start-up costs more than the passes it saves.
+NUMBA_MIN_SIZE = 100_000
+
+
+@lru_cache(maxsize=None)
+def _numba_safe_divide_kernel() -> Optional[Callable[..., None]]:
+    """
+    Import numba and build the fused safe_divide kernel on first use.
+
+    Deferred so that runs which never divide large arrays do not pay for the
+    numba import. Returns None when numba is not installed.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    # fastmath is deliberately off: it lets LLVM assume no NaN/inf, which
+    # would turn the isfinite check into a no-op.
+    @numba.njit(parallel=True, cache=True)
+    def kernel(num, den, default, out):
+        for i in numba.prange(num.size):
+            d = den[i]
+            v = num[i] / d if d != 0.0 else default
+            out[i] = v if np.isfinite(v) else default
+
+    return kernel
+
+
 def safe_divide(
     numerator: Union[float, np.ndarray, pd.Series],
     denominator: Union[float, np.ndarray, pd.Series],
@@ -120,24 +200,93 @@ def safe_divide(
 
     Returns
     -------
-    float, ndarray, or Series
-        Result of division with safe handling of zero denominators.
-    """
-    with np.errstate(divide="ignore", invalid="ignore"):
-        result = np.divide(numerator, denominator)
-    
-    # Replace inf and nan values with default
-    if isinstance(result, (np.ndarray, pd.Series)):
-        result = np.where(np.isfinite(result), result, default)
-    elif not np.isfinite(result):
-        result = default
-    
+    float or ndarray
+        Result of division with safe handling of zero denominators
+        (an ndarray for array-like inputs, including Series). Two Series are
+        aligned on their index first; the result follows the aligned order.
+
+    Notes
+    -----
+    The division is only evaluated where the denominator is non-zero, so no
+    divide-by-zero work or warnings are produced. Non-finite results (e.g. from
+    NaN inputs) are also replaced by ``default``.
+
+    When Numba is installed, same-shape 1-D inputs of at least
+    ``NUMBA_MIN_SIZE`` elements with a scalar default are handled by a
+    single fused parallel kernel instead of three NumPy passes.
+    """
+    # Series are matched by index label (as pandas arithmetic does) before
+    # dropping to positional NumPy arrays
+    if isinstance(numerator, pd.Series) and isinstance(denominator, pd.Series):
+        numerator, denominator = numerator.align(denominator)
+
+    num = np.asarray(numerator, dtype=np.float64)
+    den = np.asarray(denominator, dtype=np.float64)
+
+    if (
+        num.ndim == 1
+        and num.shape == den.shape
+        and num.size >= NUMBA_MIN_SIZE
+        and np.ndim(default) == 0
+    ):
+        kernel = _numba_safe_divide_kernel()
+        if kernel is not None:
+            result = np.empty_like(num)
+            kernel(num, den, float(default), result)
+            return result
+
+    # Divide only where the denominator is non-zero; elsewhere keep default
+    result = np.full(np.broadcast_shapes(num.shape, den.shape), default, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        np.divide(num, den, out=result, where=(den != 0))
+
+    # Replace remaining non-finite values (e.g. NaN inputs) with default, in place
+    np.copyto(result, default, where=~np.isfinite(result))
+
+    if result.ndim == 0:
+        return result[()]
+
     return result
 
 
+# Encoded log lines waiting to be written to stdout (see flush_logs)
+_LOG_BUF = bytearray()
+
+
+def flush_logs() -> None:
+    """
+    Write buffered log messages to stdout in a single call.
+
+    Called automatically at interpreter exit and by the pipeline at stage
+    boundaries; call it explicitly before forking worker processes and at the
+    end of work done inside them.
+    """
+    if not _LOG_BUF:
+        return
+
+    # Take a snapshot and drop exactly those bytes, so lines appended
+    # concurrently by other threads are kept for the next flush
+    data = bytes(_LOG_BUF)
+    del _LOG_BUF[: len(data)]
+
+    # Keep ordering with anything already printed through sys.stdout
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(data)
+        buffer.flush()
+    else:
+        # Text-only stdout (e.g. notebooks or captured output)
+        sys.stdout.write(data.decode("utf-8"))
+        sys.stdout.flush()
+
+
+atexit.register(flush_logs)
+
+
 def log(message: str) -> None:
     """
-    Print a standardized log message to stdout.
+    Write a standardized log message to stdout.
 
     Parameters
     ----------
@@ -148,5 +297,6 @@ def log(message: str) -> None:
     -----
     This is intentionally simple. For a course project, a lightweight
     logger is preferable to introducing logging frameworks.
+    Messages are buffered rather than flushed one by one; see flush_logs.
     """
-    print(f"[INFO] {message}", file=sys.stdout)
\ No newline at end of file
+    _LOG_BUF.extend(f"[INFO] {message}\n".encode("utf-8"))
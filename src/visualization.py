@@ -14,19 +14,33 @@ E) kaya_lmdi_waterfall.png — waterfall charts showing LMDI effects
 
 All figures use matplotlib for consistency and clarity.
 No external styling frameworks or seaborn; pure matplotlib defaults.
+The backend is left to the caller (main.py selects the non-interactive Agg).
 """
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import matplotlib
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
 from src.config import Config
-from src.utils import log
+from src.utils import flush_logs, log
+
+
+# Rendering settings applied only while this module's figures are built
+# (decimate near-coincident line vertices, render long paths in chunks);
+# the caller's global rcParams and backend are left untouched
+FIGURE_RC = {
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
 
 
 # =====================================================================
@@ -43,8 +57,21 @@ def _save_figure(fig: plt.Figure, path: Path) -> None:
         Figure object to save.
     path : Path
         Destination path (should end in .png or .pdf).
+
+    Notes
+    -----
+    The layout is tightened once with ``tight_layout`` instead of
+    ``bbox_inches="tight"``, which renders the figure a second time just to
+    measure it. PNGs use light zlib compression (larger files, faster saves).
     """
-    fig.savefig(str(path), bbox_inches="tight", dpi=150)
+    fmt = path.suffix.lstrip(".").lower()
+    save_kwargs: Dict[str, Any] = {"format": fmt, "dpi": 150}
+    if fmt == "png":
+        save_kwargs["pil_kwargs"] = {"compress_level": 1}
+
+    fig.tight_layout()
+    with open(path, "wb") as f:
+        fig.savefig(f, **save_kwargs)
     plt.close(fig)
     log(f"Figure saved: {path}")
 
@@ -53,6 +80,7 @@ def _save_figure(fig: plt.Figure, path: Path) -> None:
 # Figure A: Total CO2 timeseries
 # =====================================================================
 
+@plt.rc_context(FIGURE_RC)
 def plot_total_co2_timeseries(
     total_by_year: pd.DataFrame,
     config: Config,
@@ -69,11 +97,14 @@ def plot_total_co2_timeseries(
     """
     log("Generating total CO₂ timeseries figure")
 
-    df = total_by_year.sort_values("year")
+    # matplotlib only needs two 1-D arrays: order them with NumPy directly
+    years = total_by_year["year"].to_numpy()
+    co2 = total_by_year["co2"].to_numpy(dtype=np.float64, na_value=np.nan)
+    order = np.argsort(years, kind="stable")
 
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    ax.plot(df["year"], df["co2"], linewidth=2, color="black", label="Total CO₂")
+    ax.plot(years[order], co2[order], linewidth=2, color="black", label="Total CO₂")
 
     ax.set_title("Global CO₂ Emissions Over Time", fontsize=14, fontweight="bold")
     ax.set_xlabel("Year", fontsize=12)
@@ -89,6 +120,7 @@ def plot_total_co2_timeseries(
 # Figure B: Sector emissions timeseries
 # =====================================================================
 
+@plt.rc_context(FIGURE_RC)
 def plot_sector_emissions_timeseries(
     sector_long: pd.DataFrame,
     config: Config,
@@ -105,11 +137,17 @@ def plot_sector_emissions_timeseries(
     """
     log("Generating sector emissions timeseries figure")
 
-    df = sector_long.sort_values(["sector", "year"])
+    # groupby keeps row order within each group, so year-sorted input (as
+    # produced by extract_sector_long) needs no re-sort
+    if sector_long["year"].is_monotonic_increasing:
+        df = sector_long
+    else:
+        df = sector_long.sort_values(["sector", "year"])
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
-    for sector, group in df.groupby("sector"):
+    # Categorical sector: groups come out in canonical order, one pass over codes
+    for sector, group in df.groupby("sector", observed=True):
         ax.plot(
             group["year"],
             group["emissions_mtco2"],
@@ -134,6 +172,7 @@ def plot_sector_emissions_timeseries(
 # Figure C: Sector shares stacked area
 # =====================================================================
 
+@plt.rc_context(FIGURE_RC)
 def plot_sector_shares_stacked_area(
     sector_shares: pd.DataFrame,
     config: Config,
@@ -150,23 +189,25 @@ def plot_sector_shares_stacked_area(
     """
     log("Generating sector shares stacked area figure")
 
-    # Pivot to wide format for stacked area
-    df_pivot = sector_shares.pivot(
+    # Pivot to wide format for stacked area (missing cells filled in the same pass)
+    df_pivot = sector_shares.pivot_table(
         index="year",
         columns="sector",
         values="share_of_total",
-    ).fillna(0)
+        aggfunc="first",
+        fill_value=0,
+        observed=True,
+        dropna=False,
+    )
 
-    # Ensure consistent sector order (Coal, Oil, Gas, Cement, Flaring, Other)
-    desired_order = ["Coal", "Oil", "Gas", "Cement", "Flaring", "Other industry"]
-    available_cols = [c for c in desired_order if c in df_pivot.columns]
-    df_pivot = df_pivot[available_cols]
+    # One ndarray for the whole pivot; stackplot takes one row per sector
+    arr = df_pivot.to_numpy(dtype=np.float64)
 
     fig, ax = plt.subplots(figsize=(12, 7))
 
     ax.stackplot(
         df_pivot.index,
-        df_pivot.T.values,
+        arr.T,
         labels=df_pivot.columns,
         alpha=0.8,
     )
@@ -186,6 +227,7 @@ def plot_sector_shares_stacked_area(
 # Figure D: Sector contribution to YoY change (last 20 years)
 # =====================================================================
 
+@plt.rc_context(FIGURE_RC)
 def plot_sector_contribution_yoy_latest(
     contribution_to_yoy: pd.DataFrame,
     config: Config,
@@ -205,42 +247,48 @@ def plot_sector_contribution_yoy_latest(
     """
     log(f"Generating sector contribution to YoY figure (last {n_years} years)")
 
-    df = contribution_to_yoy.sort_values("year").copy()
+    df = contribution_to_yoy
 
-    # Get most recent n_years
+    # Get most recent n_years (no sort needed: pivot orders the year index)
     max_year = df["year"].max()
     min_year = max(df["year"].min(), max_year - n_years + 1)
-    df = df[df["year"] >= min_year].copy()
+    df = df[df["year"] >= min_year]
 
-    # Pivot for stacked bar chart
-    df_pivot = df.pivot(
+    # Pivot for stacked bar chart (missing cells filled in the same pass)
+    df_pivot = df.pivot_table(
         index="year",
         columns="sector",
         values="delta_mtco2",
-    ).fillna(0)
-
-    # Ensure consistent sector order
-    desired_order = ["Coal", "Oil", "Gas", "Cement", "Flaring", "Other industry"]
-    available_cols = [c for c in desired_order if c in df_pivot.columns]
-    df_pivot = df_pivot[available_cols]
+        aggfunc="first",
+        fill_value=0,
+        observed=True,
+        dropna=False,
+    )
 
     fig, ax = plt.subplots(figsize=(12, 6))
 
     x_pos = np.arange(len(df_pivot.index))
     width = 0.7
 
-    # Create stacked bar chart
-    bottom = np.zeros(len(df_pivot.index))
-    for col in df_pivot.columns:
+    # Create stacked bar chart: each sector sits on the cumulative sum of the
+    # sectors before it, computed in one pass
+    vals = df_pivot.to_numpy(dtype=np.float64)
+    bottoms = np.zeros_like(vals)
+    bottoms[:, 1:] = np.cumsum(vals, axis=1)[:, :-1]
+
+    # Same colors as the default cycle, looked up once rather than per bar call
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+
+    for i, col in enumerate(df_pivot.columns):
         ax.bar(
             x_pos,
-            df_pivot[col].values,
+            vals[:, i],
             width,
             label=col,
-            bottom=bottom,
+            bottom=bottoms[:, i],
+            color=colors[i % len(colors)],
             alpha=0.8,
         )
-        bottom += df_pivot[col].values
 
     ax.set_title(
         f"Sector Contributions to Annual CO₂ Change (Last {n_years} Years)",
@@ -263,6 +311,7 @@ def plot_sector_contribution_yoy_latest(
 # Figure E: Kaya LMDI waterfall
 # =====================================================================
 
+@plt.rc_context(FIGURE_RC)
 def plot_kaya_lmdi_waterfall(
     lmdi_decomposition: pd.DataFrame,
     config: Config,
@@ -318,7 +367,6 @@ def plot_kaya_lmdi_waterfall(
         ax.axhline(0, color="black", linewidth=0.8)
         ax.grid(True, alpha=0.3, axis="y")
 
-    plt.tight_layout()
     path = config.paths.figures_dir / "kaya_lmdi_waterfall.png"
     _save_figure(fig, path)
 
@@ -327,6 +375,61 @@ def plot_kaya_lmdi_waterfall(
 # Main orchestration
 # =====================================================================
 
+FigureJob = Tuple[str, Callable[..., None], Dict[str, Any]]
+
+# Set to "1" to render figures in parallel worker processes
+PARALLEL_FIGURES_ENV = "PIPELINE_PARALLEL_FIGURES"
+
+
+def _figure_jobs(
+    total_by_year: pd.DataFrame,
+    sector_long: pd.DataFrame,
+    sector_shares: pd.DataFrame,
+    contribution_to_yoy: pd.DataFrame,
+    lmdi_decomposition: pd.DataFrame,
+    config: Config,
+) -> List[FigureJob]:
+    """
+    Build the list of independent figure jobs as (name, function, kwargs).
+    """
+    return [
+        ("total_co2_timeseries", plot_total_co2_timeseries,
+         {"total_by_year": total_by_year, "config": config}),
+        ("sector_emissions_timeseries", plot_sector_emissions_timeseries,
+         {"sector_long": sector_long, "config": config}),
+        ("sector_shares_stacked_area", plot_sector_shares_stacked_area,
+         {"sector_shares": sector_shares, "config": config}),
+        ("sector_contribution_yoy_latest", plot_sector_contribution_yoy_latest,
+         {"contribution_to_yoy": contribution_to_yoy, "config": config}),
+        ("kaya_lmdi_waterfall", plot_kaya_lmdi_waterfall,
+         {"lmdi_decomposition": lmdi_decomposition, "config": config}),
+    ]
+
+
+def _init_worker() -> None:
+    """
+    Select the non-interactive Agg backend in a figure worker process.
+
+    Workers only write files. Under the spawn/forkserver start methods they
+    do not inherit the parent's backend choice, so it is set explicitly.
+    """
+    matplotlib.use("Agg")
+
+
+def _render(job: FigureJob) -> str:
+    """
+    Run a single figure job (executed in a worker process).
+    """
+    name, fn, kwargs = job
+    try:
+        fn(**kwargs)
+    finally:
+        # Worker processes exit without running atexit hooks; flush even when
+        # the figure fails so its log lines are not lost
+        flush_logs()
+    return name
+
+
 def generate_all_figures(
     total_by_year: pd.DataFrame,
     sector_long: pd.DataFrame,
@@ -338,6 +441,10 @@ def generate_all_figures(
     """
     Generate all required visualization figures.
 
+    The figures are independent of each other. They are rendered serially in
+    this process, or in parallel worker processes when the
+    ``PIPELINE_PARALLEL_FIGURES`` environment variable is set to ``"1"``.
+
     Parameters
     ----------
     total_by_year : pd.DataFrame
@@ -355,10 +462,31 @@ def generate_all_figures(
     """
     log("Starting figure generation")
 
-    plot_total_co2_timeseries(total_by_year, config)
-    plot_sector_emissions_timeseries(sector_long, config)
-    plot_sector_shares_stacked_area(sector_shares, config)
-    plot_sector_contribution_yoy_latest(contribution_to_yoy, config)
-    plot_kaya_lmdi_waterfall(lmdi_decomposition, config)
+    jobs = _figure_jobs(
+        total_by_year=total_by_year,
+        sector_long=sector_long,
+        sector_shares=sector_shares,
+        contribution_to_yoy=contribution_to_yoy,
+        lmdi_decomposition=lmdi_decomposition,
+        config=config,
+    )
 
-    log("All figures generated successfully")
\ No newline at end of file
+    if os.environ.get(PARALLEL_FIGURES_ENV, "0") == "1":
+        # Flush pending output so forked workers do not inherit (and repeat) it
+        flush_logs()
+
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker
+        ) as executor:
+            futures = [executor.submit(_render, job) for job in jobs]
+            wait(futures)
+
+        # Re-raise the first failure, if any
+        for future in futures:
+            future.result()
+    else:
+        for job in jobs:
+            _render(job)
+
+    log("All figures generated successfully")
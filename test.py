@@ -0,0 +1,107 @@
+"""
+test.py
+
+Regression tests for the optional accelerated code paths.
+
+Each optional path (Polars, Numba) must give exactly the same result as the
+default implementation. Tests for an accelerator are skipped when it is not
+installed. Run with:
+
+    python -m unittest test
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from src import utils
+from src.sector_mapping import (
+    SECTOR_COLUMNS,
+    _extract_sector_long_numpy,
+    _extract_sector_long_polars,
+)
+
+
+HAS_POLARS = importlib.util.find_spec("polars") is not None
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+def _make_world_frame(arrow: bool) -> pd.DataFrame:
+    """
+    Build a small World-like frame with gaps in the sector columns.
+    """
+    rng = np.random.default_rng(0)
+    years = np.arange(1990, 2010, dtype=np.int32)
+
+    df = pd.DataFrame({"year": years})
+    for col in SECTOR_COLUMNS:
+        values = rng.uniform(0.0, 100.0, size=years.size)
+        values[rng.random(years.size) < 0.2] = np.nan
+        df[col] = values
+
+    if arrow:
+        df = df.convert_dtypes(dtype_backend="pyarrow")
+    return df
+
+
+@unittest.skipUnless(HAS_POLARS, "polars is not installed")
+class TestExtractSectorLongParity(unittest.TestCase):
+    """
+    The Polars and NumPy reshapes of extract_sector_long must agree.
+    """
+
+    def test_numpy_dtypes(self):
+        df_world = _make_world_frame(arrow=False)
+        pd.testing.assert_frame_equal(
+            _extract_sector_long_polars(df_world),
+            _extract_sector_long_numpy(df_world),
+        )
+
+    def test_arrow_dtypes(self):
+        df_world = _make_world_frame(arrow=True)
+        pd.testing.assert_frame_equal(
+            _extract_sector_long_polars(df_world),
+            _extract_sector_long_numpy(df_world),
+        )
+
+
+@unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+class TestSafeDivideNumbaParity(unittest.TestCase):
+    """
+    The fused Numba kernel must match the NumPy path of safe_divide.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = utils.NUMBA_MIN_SIZE + 1
+        self.num = rng.normal(size=n)
+        self.den = rng.normal(size=n)
+        self.den[::7] = 0.0
+        self.num[::11] = np.nan
+        self.den[::13] = np.inf
+        self.num[::17] = -np.inf
+
+    def _compare(self, default):
+        self.assertIsNotNone(utils._numba_safe_divide_kernel())
+        fused = utils.safe_divide(self.num, self.den, default)
+
+        # Raising the threshold forces the NumPy implementation
+        with mock.patch.object(utils, "NUMBA_MIN_SIZE", self.num.size + 1):
+            reference = utils.safe_divide(self.num, self.den, default)
+
+        np.testing.assert_array_equal(fused, reference)
+
+    def test_nan_default(self):
+        self._compare(np.nan)
+
+    def test_zero_default(self):
+        self._compare(0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()